@@ -1,6 +1,7 @@
 # auth/routes.py
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from datetime import timedelta
 from typing import Annotated
@@ -23,8 +24,8 @@ async def login_for_access_token(
             detail="Incorrect username or password",
         )
 
-    # check password validity
-    if not verify_password(form_data.password, user.hashed_password):
+    # check password validity; bcrypt is CPU-bound, so keep it off the event loop
+    if not await run_in_threadpool(verify_password, form_data.password, user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect username or password",
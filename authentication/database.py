@@ -10,45 +10,61 @@ from datetime import datetime, timedelta
 from typing import Optional
 
 import os
+import time
 from dotenv import load_dotenv
 load_dotenv()
 
-from jose import JWTError, jwt
+import jwt
 import bcrypt
 
+# bcrypt work factor for newly hashed passwords. Verification cost follows the
+# factor stored in each hash, so lower it (e.g. 4) only for development data.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+
+
+# Only needed when creating new users; the demo users below store precomputed hashes.
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(BCRYPT_ROUNDS)).decode('utf-8')
 
 
-users_db = {
+# Hashes are precomputed (bcrypt, cost 12) so importing this module doesn't pay for hashing.
+_raw_users = {
     "tom": {
         "username": "tom",
         "email": "tom@example.com",
-        "hashed_password": hash_password("tompassword"),
+        "hashed_password": "$2b$12$yniV90qB2TqNs4ZYBHgLLOc8W9K1nSl7KlNm2HygPBhApheMeUVry",  # "tompassword"
         "disabled": False,
     },
     "jerry": {
         "username": "jerry",
         "email": "jerry@example.com",
-        "hashed_password": hash_password("jerrypassword"),
+        "hashed_password": "$2b$12$VK7PcWzSEBoiZhawo/qBC.sC7BvqMe8f92COar27b05OK2w1uYwwW",  # "jerrypassword"
         "disabled": True,
     },
 }
 
+# Validated once at import; lookups return these instances directly
+users_db = {username: UserInDB(**user_dict) for username, user_dict in _raw_users.items()}
+
 
 def get_user(username: str) -> UserInDB | None:
-    user_dict = users_db.get(username)
-    if user_dict:
-        return UserInDB(**user_dict)
-    return None
+    return users_db.get(username)
 
 
 SECRET_KEY = os.getenv("SECRET_KEY")
 if not SECRET_KEY:
     raise ValueError("SECRET_KEY environment variable not set")
 ALGORITHM = "HS256"
+# Encode the HMAC key once instead of on every sign/verify call
+_SECRET_KEY_BYTES = SECRET_KEY.encode("utf-8")
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Decoded tokens are cached briefly (never past their own expiry) so that
+# repeat requests with the same bearer token skip JWT verification
+TOKEN_CACHE_TTL_SECONDS = 60
+TOKEN_CACHE_MAX_SIZE = 10_000
+_token_cache: dict[str, tuple[UserInDB, float]] = {}
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
@@ -60,17 +76,30 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=30))
     to_encode.update({"exp": expire})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    return jwt.encode(to_encode, _SECRET_KEY_BYTES, algorithm=ALGORITHM)
 
 
 def decode_access_token(token: str) -> Optional[UserInDB]:
+    cached = _token_cache.get(token)
+    if cached is not None:
+        user, cached_until = cached
+        if time.time() < cached_until:
+            return user
+        _token_cache.pop(token, None)
+
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt.decode(token, _SECRET_KEY_BYTES, algorithms=[ALGORITHM])
         username: str = payload.get("sub")
         if username is None:
             return None
-    except JWTError:
+    except jwt.PyJWTError:
         return None
 
     user = get_user(username)
+    # PyJWT checks "exp" only when the token has one; tokens without it are not cached
+    expires_at = payload.get("exp")
+    if user is not None and expires_at is not None:
+        if len(_token_cache) >= TOKEN_CACHE_MAX_SIZE:
+            _token_cache.clear()
+        _token_cache[token] = (user, min(expires_at, time.time() + TOKEN_CACHE_TTL_SECONDS))
     return user
\ No newline at end of file
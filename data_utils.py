@@ -1,3 +1,9 @@
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 from pathlib import Path as FilePath
 from utils import (
@@ -5,21 +11,260 @@ from utils import (
     get_latest_assessment_file,
     get_latest_cp_file,
     normalize_company_id,
+    normalize_company_ids,
 )
-from datetime import datetime
 from filters import CompanyFilters, MQFilter
+from log_config import get_logger
+
+logger = get_logger(__name__)
+
+# Project root, resolved once at import
+BASE_DIR = FilePath(__file__).resolve().parent
+
+# Directory holding the dated data folders (see find_data_dir)
+BASE_DATA_DIR = BASE_DIR / "data"
+
+# Directory holding Parquet copies of the source CSV files (see _read_csv)
+PARQUET_CACHE_DIR = FilePath(os.getenv("PARQUET_CACHE_DIR", BASE_DIR / ".cache"))
+
+# Number of pages of each unfiltered dataset kept in memory (see _page_cache)
+PAGE_CACHE_SIZE = 1024
+
+# Low-cardinality text columns stored as pandas categoricals
+CATEGORY_COLUMNS = ("sector", "geography", "_normalized_id", "_sector_key")
+
+# Numeric management quality scores for the STAR rating levels
+STAR_MAPPING = {
+    "0STAR": 0.0,
+    "1STAR": 1.0,
+    "2STAR": 2.0,
+    "3STAR": 3.0,
+    "4STAR": 4.0,
+    "5STAR": 5.0,
+}
+
+@lru_cache(maxsize=None)
+def find_data_dir(prefix: str = "TPI_sector_data_All_sectors_") -> FilePath:
+    """Find the latest data directory, scanning the data folder once per prefix.
+    
+    Args:
+        prefix (str): Prefix of the dated data folder names
+        
+    Returns:
+        Path: The latest matching data directory
+    """
+    return get_latest_data_dir(BASE_DATA_DIR, prefix)
+
+
+@lru_cache(maxsize=None)
+def find_mq_files() -> list:
+    """Find the MQ assessment files in the latest data directory.
+    
+    The result is shared by every caller and must be treated as read-only.
+    
+    Returns:
+        list: Sorted MQ assessment file paths, one per methodology cycle
+        
+    Raises:
+        FileNotFoundError: If no MQ datasets are found
+    """
+    data_dir = find_data_dir()
+    mq_files = sorted(data_dir.glob("MQ_Assessments_Methodology_*.csv"))
+    if not mq_files:
+        raise FileNotFoundError(f"No MQ datasets found in {data_dir}")
+    return mq_files
+
 
 class BaseDataHandler:
     """Base class for handling data operations with common functionality.
     
     This class provides basic DataFrame operations and pagination functionality
     that can be inherited by specific data handlers.
+
+    Loaded datasets are shared by every handler instance in the process and must
+    be treated as read-only: filters rebind ``self._df`` to a new, filtered frame
+    rather than modifying the shared one.
     """
+
+    # Datasets loaded so far, keyed by dataset name (see _load_once)
+    _loaded_data = {}
     
     def __init__(self):
         """Initialize the base data handler with empty DataFrame and files list."""
         self._df = pd.DataFrame()
         self._files = []
+        # Shared dataset, its per-company row positions, latest record of each
+        # company and page cache (see _load_dataset)
+        self._full_df = None
+        self._company_index = None
+        self._latest_df = None
+        self._page_cache = None
+
+    def _load_once(self, key: str, loader):
+        """Return the result of ``loader``, running it only once per process.
+        
+        Args:
+            key (str): Name under which the loaded result is shared
+            loader (callable): Zero-argument function that loads the data
+            
+        Returns:
+            The (shared) result of ``loader``.
+        """
+        if key not in BaseDataHandler._loaded_data:
+            BaseDataHandler._loaded_data[key] = loader()
+        return BaseDataHandler._loaded_data[key]
+
+    def _load_dataset(self, key: str, loader):
+        """Load a shared dataset along with its per-company row index.
+        
+        The index maps each normalized company ID to the row positions of that
+        company, so history lookups on the unfiltered dataset skip the full scan.
+        The latest record of each company is selected once, and pages of the
+        unfiltered dataset are cached as well.
+        
+        Args:
+            key (str): Name under which the dataset is shared
+            loader (callable): Zero-argument function that loads the DataFrame
+            
+        Returns:
+            pd.DataFrame: The shared dataset.
+        """
+        df = self._load_once(key, loader)
+        self._full_df = df
+        self._company_index = self._load_once(
+            f"{key}_company_index",
+            lambda: df.groupby("_normalized_id", observed=True).indices,
+        )
+        if "_assessment_dt" in df.columns:
+            self._latest_df = self._load_once(
+                f"{key}_latest", lambda: self._latest_records(df)
+            )
+        self._page_cache = self._load_once(
+            f"{key}_page_cache", lambda: self._build_page_cache(df)
+        )
+        return df
+
+    def _build_page_cache(self, df: pd.DataFrame):
+        """Build an LRU cache of pages of an unfiltered, shared dataset.
+        
+        The cached function takes ``(kind, page, per_page)``, where ``kind`` is
+        ``"all"`` for the dataset itself or ``"latest"`` for the latest record
+        of each company (``self._latest_df``). Cached pages are shared and must
+        be treated as read-only.
+        
+        Args:
+            df (pd.DataFrame): The shared dataset
+            
+        Returns:
+            callable: Cached page lookup function
+        """
+        latest_df = self._latest_df
+
+        @lru_cache(maxsize=PAGE_CACHE_SIZE)
+        def page_of(kind: str, page: int, per_page: int) -> pd.DataFrame:
+            source = latest_df if kind == "latest" else df
+            return self.paginate(source, page, per_page)
+
+        return page_of
+
+    def _is_unfiltered(self) -> bool:
+        """Check whether the handler still works on the whole shared dataset."""
+        return self._full_df is not None and self._df is self._full_df
+
+    def _read_csv(self, path: FilePath) -> pd.DataFrame:
+        """Read a CSV file, reusing a Parquet copy of it when one is up to date.
+        
+        CSVs are parsed with the PyArrow engine and written to PARQUET_CACHE_DIR.
+        The cache file name records the source's size and modification time, so
+        an edited or replaced CSV is parsed again on the next load.
+        
+        Args:
+            path (Path): CSV file to read
+            
+        Returns:
+            pd.DataFrame: Contents of the CSV file
+        """
+        path = FilePath(path)
+        stat = path.stat()
+        cache_path = PARQUET_CACHE_DIR / f"{path.stem}-{stat.st_size}-{stat.st_mtime_ns}.parquet"
+        df = None
+        if cache_path.exists():
+            try:
+                df = pd.read_parquet(cache_path)
+            except Exception as e:
+                # An unreadable cache file is a miss; parse the CSV and rewrite it
+                logger.warning(f"Discarding unreadable Parquet cache {cache_path}: {e}")
+                cache_path.unlink(missing_ok=True)
+        if df is None:
+            df = pd.read_csv(path, engine="pyarrow")
+            self._write_parquet_cache(df, path, cache_path)
+        # Arrow marks missing text as None; use NaN like the default CSV reader
+        return df.fillna(np.nan)
+
+    def _write_parquet_cache(self, df: pd.DataFrame, path: FilePath, cache_path: FilePath):
+        """Write the Parquet copy of a CSV file and remove outdated copies.
+        
+        The file is written under a temporary name in PARQUET_CACHE_DIR and then
+        renamed onto cache_path, so other processes never see a partial file.
+        
+        Args:
+            df (pd.DataFrame): Parsed contents of the CSV file
+            path (Path): Source CSV file
+            cache_path (Path): Parquet file to write
+        """
+        tmp_path = None
+        try:
+            PARQUET_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(dir=PARQUET_CACHE_DIR, prefix=f".{path.stem}-", suffix=".tmp")
+            os.close(fd)
+            tmp_path = FilePath(tmp_name)
+            df.to_parquet(tmp_path)
+            os.replace(tmp_path, cache_path)
+            tmp_path = None
+            for stale in PARQUET_CACHE_DIR.glob(f"{path.stem}-*.parquet"):
+                if stale.name != cache_path.name:
+                    stale.unlink(missing_ok=True)
+        except Exception as e:
+            # The cache is optional; keep serving from the parsed CSV
+            logger.warning(f"Could not write Parquet cache for {path}: {e}")
+        finally:
+            if tmp_path is not None:
+                tmp_path.unlink(missing_ok=True)
+
+    def _read_csvs(self, paths: list) -> list:
+        """Read several CSV files concurrently.
+        
+        Parsing releases the GIL, so the files are read on a small thread pool.
+        
+        Args:
+            paths (list): CSV files to read
+            
+        Returns:
+            list: DataFrames in the same order as ``paths``
+        """
+        if not paths:
+            return []
+        with ThreadPoolExecutor(max_workers=min(8, len(paths))) as executor:
+            return list(executor.map(self._read_csv, paths))
+
+    def _concat_frames(self, frames: list) -> pd.DataFrame:
+        """Concatenate DataFrames whose columns only partly overlap.
+        
+        Every frame is first aligned to the union of all columns, in order of
+        first appearance. The concat then joins identical layouts instead of
+        reconciling the columns frame by frame. A single frame is returned as is.
+        
+        Args:
+            frames (list): DataFrames to concatenate
+            
+        Returns:
+            pd.DataFrame: Concatenated DataFrame with a fresh RangeIndex
+        """
+        if len(frames) == 1:
+            return frames[0]
+        columns = list(dict.fromkeys(col for df in frames for col in df.columns))
+        aligned = [df.reindex(columns=columns) for df in frames]
+        return pd.concat(aligned, ignore_index=True)
 
     def get_df(self):
         """Get the current DataFrame.
@@ -66,8 +311,61 @@ class BaseDataHandler:
         """
         start_idx = (page - 1) * per_page
         end_idx = start_idx + per_page
-        return df.iloc[start_idx:end_idx].fillna("N/A").infer_objects(copy=False)
+        page_df = df.iloc[start_idx:end_idx]
+        # Only text columns get the "N/A" fill; numeric and date columns keep
+        # their dtype and stay NaN/NaT where missing.
+        text_cols = page_df.select_dtypes(include=["object", "category"]).columns
+        fills = {col: "N/A" for col in text_cols if page_df[col].hasnans}
+        if not fills:
+            return page_df
+        # Categoricals only accept known values, so fill them as plain objects
+        page_df = page_df.astype(
+            {col: object for col in fills if page_df[col].dtype == "category"}
+        )
+        return page_df.fillna(fills)
     
+    def _categorize(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Convert the low-cardinality text columns of a DataFrame to categoricals.
+        
+        Args:
+            df (pd.DataFrame): DataFrame to convert
+            
+        Returns:
+            pd.DataFrame: The DataFrame with CATEGORY_COLUMNS stored as categories
+        """
+        columns = [col for col in CATEGORY_COLUMNS if col in df.columns]
+        return df.astype({col: "category" for col in columns})
+
+    def _downcast(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Store the integer columns of a DataFrame in the smallest integer type.
+        
+        Float columns are left as float64, since narrowing them would change
+        the values returned by the API.
+        
+        Args:
+            df (pd.DataFrame): DataFrame to convert
+            
+        Returns:
+            pd.DataFrame: The DataFrame with downcast integer columns
+        """
+        columns = df.select_dtypes(include=["integer"]).columns
+        return df.assign(
+            **{col: pd.to_numeric(df[col], downcast="integer") for col in columns}
+        )
+
+    def _contains_any(self, column: pd.Series, values: list) -> pd.Series:
+        """Return a mask of rows whose text contains any of the given values.
+        
+        Args:
+            column (pd.Series): Column to search, compared as strings
+            values (list): Substrings to look for
+            
+        Returns:
+            pd.Series: Boolean mask aligned with ``column``
+        """
+        pattern = "|".join(re.escape(value) for value in values)
+        return column.astype(str).str.contains(pattern, regex=True)
+
     def _sanitize_text(self, text: str, preserve_case: bool = False) -> str:
         """
         Sanitize text by stripping whitespace and optionally converting to lowercase.
@@ -118,9 +416,10 @@ class BaseDataHandler:
 
     def get_company_history(self,company_id: str):
         normalized_company_id = normalize_company_id(company_id)
-        mask = (
-            self._df["company name"].apply(normalize_company_id) == normalized_company_id
-        )
+        if self._is_unfiltered():
+            positions = self._company_index.get(normalized_company_id, [])
+            return self._df.iloc[positions]
+        mask = self._df["_normalized_id"] == normalized_company_id
         company = self._df[mask]
         return company
     
@@ -131,14 +430,40 @@ class BaseDataHandler:
         latest_record = company.iloc[-1]
         return latest_record.fillna("N/A")
     
+    def get_page(self, page: int, per_page: int) -> pd.DataFrame:
+        """Get one page of the current DataFrame.
+        
+        Pages of the unfiltered dataset come from the shared page cache.
+        
+        Args:
+            page (int): Page number (1-based)
+            per_page (int): Number of items per page
+            
+        Returns:
+            pd.DataFrame: Paginated slice of the current DataFrame
+        """
+        if self._is_unfiltered():
+            return self._page_cache("all", page, per_page)
+        return self.paginate(self._df, page, per_page)
+
+    def _latest_records(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Select the latest record of each company, ordered by assessment date.
+        
+        The latest record per company is picked on the parsed assessment date
+        with a single groupby reduction.
+        """
+        assessment_dt = df["_assessment_dt"].dropna()
+        latest_idx = assessment_dt.groupby(df["company name"]).idxmax()
+        return df.loc[latest_idx].sort_values("_assessment_dt", kind="stable")
+
     def get_latest_assessments(self, page: int, page_size: int):
-        """Get latest assessments with pagination."""
-        latest_records = (
-            self._df.sort_values("assessment date")
-            .groupby("company name")
-            .tail(1)
-        )
-        return self.paginate(latest_records, page, page_size)
+        """Get latest assessments with pagination.
+
+        Pages of the unfiltered dataset come from the shared page cache.
+        """
+        if self._is_unfiltered():
+            return self._page_cache("latest", page, page_size)
+        return self.paginate(self._latest_records(self._df), page, page_size)
     
     def apply_company_filter(self, filters: CompanyFilters):
         """Apply filters to the DataFrame.
@@ -149,9 +474,8 @@ class BaseDataHandler:
         Returns:
             pd.DataFrame: Filtered DataFrame with only matching records
         """    
-        # Create a copy of the DataFrame to avoid modifying original
-
-        filtered_df = self._df.copy()
+        # Boolean indexing returns new frames, so the shared DataFrame is never modified
+        filtered_df = self._df
         
         # Apply geography filter
         if filters.geography:
@@ -181,19 +505,11 @@ class BaseDataHandler:
             
         # Apply ISIN filter
         if filters.isins:
-            if isinstance(filters.isins, str):
-                filtered_df = filtered_df[filtered_df["isins"].str.contains(filters.isins, na=False)]
-            else:
-                mask = filtered_df["isins"].apply(lambda x: any(isin in str(x) for isin in filters.isins))
-                filtered_df = filtered_df[mask]
+            filtered_df = filtered_df[self._contains_any(filtered_df["isins"], filters.isins)]
                 
         # Apply SEDOL filter
         if filters.sedol:
-            if isinstance(filters.sedol, str):
-                filtered_df = filtered_df[filtered_df["sedol"].str.contains(filters.sedol, na=False)]
-            else:
-                mask = filtered_df["sedol"].apply(lambda x: any(sedol in str(x) for sedol in filters.sedol))
-                filtered_df = filtered_df[mask]
+            filtered_df = filtered_df[self._contains_any(filtered_df["sedol"], filters.sedol)]
             
         self._df = filtered_df
 
@@ -207,7 +523,20 @@ class MQHandler(BaseDataHandler):
     def __init__(self):
         """Initialize the MQ handler and load MQ data."""
         super().__init__()
-        self._df = self.load_mq_data()
+        self.mq_files = find_mq_files()
+        self._df = self._load_dataset("mq", self.load_mq_data)
+        # Row positions of each methodology cycle in the shared dataset
+        self._cycle_index = self._load_once(
+            "mq_cycle_index", lambda: self._df.groupby("methodology_cycle").indices
+        )
+        # Row labels of each sector, already in get_sector_data's date order
+        self._sector_order = self._load_once(
+            "mq_sector_order",
+            lambda: {
+                key: group.sort_values("assessment date", ascending=False).index
+                for key, group in self._df.groupby("_sector_key", observed=True)
+            },
+        )
 
     def get_mq_files_length(self):
         """Get the number of MQ assessment files.
@@ -222,25 +551,27 @@ class MQHandler(BaseDataHandler):
         
         Returns:
             pd.DataFrame: Processed MQ assessment data
-            
-        Raises:
-            FileNotFoundError: If no MQ datasets are found
         """
-        DATA_DIR = get_latest_data_dir(FilePath(__file__).resolve().parent / "data")
-
-        self.mq_files = sorted(DATA_DIR.glob("MQ_Assessments_Methodology_*.csv"))
-        if not self.mq_files:
-            raise FileNotFoundError(f"No MQ datasets found in {DATA_DIR}")
-        print(len(self.mq_files))
-        mq_df_list = [pd.read_csv(f) for f in self.mq_files]
+        mq_df_list = self._read_csvs(self.mq_files)
 
         for idx, df in enumerate(mq_df_list, start=1):
             df["methodology_cycle"] = idx
 
-        mq_df = pd.concat(mq_df_list, ignore_index=True)
+        mq_df = self._concat_frames(mq_df_list)
         mq_df.columns = mq_df.columns.str.strip().str.lower()
 
-        return mq_df
+        # Normalize company IDs once so lookups don't re-normalize every row
+        mq_df["_normalized_id"] = normalize_company_ids(mq_df["company name"])
+        # Parse assessment dates once so requests only read the parsed values
+        mq_df["_assessment_dt"] = pd.to_datetime(
+            mq_df["assessment date"], format="%d/%m/%Y", errors="coerce"
+        )
+        # Map STAR levels to numeric scores in one pass; other levels become NaN
+        mq_df["_mq_score"] = mq_df["level"].map(STAR_MAPPING)
+        # Case-insensitive sector key, so sector lookups are a plain comparison
+        mq_df["_sector_key"] = mq_df["sector"].str.strip().str.lower()
+
+        return self._categorize(self._downcast(mq_df))
     
     
     def apply_mq_filter(self, filters: MQFilter):
@@ -249,27 +580,27 @@ class MQHandler(BaseDataHandler):
         Args:
             filters (MQFilter): Filter object containing filter parameters for filtering companies
         """
-        filtered_df = self._df.copy()
+        filtered_df = self._df
         
         if filters.assessment_year:
-            filtered_df = filtered_df[filtered_df['Assessment Date'].str.contains(str(filters.assessment_year))]
+            filtered_df = filtered_df[filtered_df["_assessment_dt"].dt.year == filters.assessment_year]
         if filtered_df.empty:
             raise ValueError(f"Assessment Year is not valid: {filters.assessment_year}")
         
-        # both of these can be simplified by using a service layer and simplying into check if valid in column name
-        if filters.mq_levels:
-            valid_mq_levels = filtered_df['MQ Level'].unique()
-            invalid_levels = [level for level in filters.mq_levels if level not in valid_mq_levels]
-            if invalid_levels:
-                raise ValueError(f"MQ Levels are not valid: {invalid_levels}")
-            filtered_df = filtered_df[filtered_df['MQ Level'].isin(filters.mq_levels)]
-
-        if filters.level:
-            valid_levels = filtered_df['Overall Management Level'].unique()
-            invalid_levels = [level for level in filters.level if level not in valid_levels]
+        # MQ Level and Overall Management Level are both the "level" column of the
+        # MQ files, which holds plain levels (3, "3") and STAR levels ("4STAR")
+        for requested, name in ((filters.mq_levels, "MQ Levels are"), (filters.level, "Overall Management Level is")):
+            if not requested:
+                continue
+            levels = pd.to_numeric(
+                filtered_df["level"].astype(str).str.extract(r"^(\d+)", expand=False),
+                errors="coerce",
+            )
+            valid_levels = set(levels.dropna().astype(int))
+            invalid_levels = [level for level in requested if level not in valid_levels]
             if invalid_levels:
-                raise ValueError(f"Overall Management Level is not valid: {invalid_levels}")
-            filtered_df = filtered_df[filtered_df['Overall Management Level'].isin(filters.level)]
+                raise ValueError(f"{name} not valid: {invalid_levels}")
+            filtered_df = filtered_df[levels.isin(requested)]
 
         self._df = filtered_df
 
@@ -289,6 +620,8 @@ class MQHandler(BaseDataHandler):
         if not 1 <= methodology_id <= len(self.mq_files):
             raise ValueError(f"Methodology ID must be between 1 and {len(self.mq_files)}")
         
+        if self._is_unfiltered():
+            return self._df.iloc[self._cycle_index.get(methodology_id, [])]
         return self._df[self._df["methodology_cycle"] == methodology_id]
 
     def get_sector_data(self, sector_id: str):
@@ -300,9 +633,11 @@ class MQHandler(BaseDataHandler):
         Returns:
             pd.DataFrame: Assessments for the specified sector, sorted by date
         """
-        sector_data = self._df[
-            self._df["sector"].str.strip().str.lower() == sector_id.strip().lower()
-        ]
+        sector_key = sector_id.strip().lower()
+        if self._is_unfiltered():
+            # Sorted once at load; the order matches sorting the subset per request
+            return self._df.loc[self._sector_order.get(sector_key, [])]
+        sector_data = self._df[self._df["_sector_key"] == sector_key]
         return sector_data.sort_values("assessment date", ascending=False)
 
 class CPHandler(BaseDataHandler):
@@ -316,7 +651,7 @@ class CPHandler(BaseDataHandler):
         self.prefix = prefix
         """Initialize the CP handler and load CP data."""
         super().__init__()
-        self._df = self.load_cp_data()
+        self._df = self._load_dataset("cp", self.load_cp_data)
 
     def load_cp_data(self):
         """Load and process CP assessment data from CSV files.
@@ -327,10 +662,7 @@ class CPHandler(BaseDataHandler):
         Raises:
             ValueError: If no CP assessment files are found or required columns are missing
         """
-        DATA_DIR = get_latest_data_dir(
-            FilePath(__file__).resolve().parent / "data",
-            prefix="TPI_sector_data_All_sectors_"
-        )
+        DATA_DIR = find_data_dir(prefix="TPI_sector_data_All_sectors_")
 
         # Get CP assessment files
         cp_files = get_latest_cp_file("CP_Assessments_*.csv", DATA_DIR)
@@ -338,7 +670,7 @@ class CPHandler(BaseDataHandler):
             raise ValueError("No CP assessment files found in data directory")
 
         # Load and process each file
-        cp_df_list = [pd.read_csv(f) for f in cp_files]
+        cp_df_list = self._read_csvs(cp_files)
         if not cp_df_list:
             raise ValueError("Failed to load CP assessment data from files")
 
@@ -346,7 +678,7 @@ class CPHandler(BaseDataHandler):
         for idx, df in enumerate(cp_df_list, start=1):
             df["assessment_cycle"] = idx
 
-        cp_df = pd.concat(cp_df_list, ignore_index=True)
+        cp_df = self._concat_frames(cp_df_list)
         cp_df.columns = cp_df.columns.str.strip().str.lower()
 
         # Validate required columns
@@ -354,8 +686,15 @@ class CPHandler(BaseDataHandler):
         missing_columns = [col for col in required_columns if col not in cp_df.columns]
         if missing_columns:
             raise ValueError(f"Required columns missing in CP dataset: {', '.join(missing_columns)}")
+
+        # Normalize company IDs once so lookups don't re-normalize every row
+        cp_df["_normalized_id"] = normalize_company_ids(cp_df["company name"])
+        # Parse assessment dates once so requests only read the parsed values
+        cp_df["_assessment_dt"] = pd.to_datetime(
+            cp_df["assessment date"], format="%d/%m/%Y", errors="coerce"
+        )
         
-        return cp_df
+        return self._categorize(self._downcast(cp_df))
 
     def get_company_alignment(self, company_id: str):
         """Get a company's carbon performance alignment status.
@@ -388,11 +727,7 @@ class CPHandler(BaseDataHandler):
         company_data = self.get_company_history(company_id)
 
         if len(company_data) < 2:
-            available_years = [
-                pd.to_datetime(date, errors="coerce").year
-                for date in company_data["assessment date"]
-            ]
-            available_years = [year for year in available_years if year is not None]
+            available_years = company_data["_assessment_dt"].dt.year.dropna().astype(int).tolist()
             return None, available_years
 
         sorted_data = company_data.sort_values("assessment date", ascending=False)
@@ -408,7 +743,7 @@ class CompanyDataHandler(BaseDataHandler):
     def __init__(self):
         """Initialize the company data handler and load company data."""
         super().__init__()
-        self._df = self.load_company_data()
+        self._df = self._load_dataset("company", self.load_company_data)
 
     def load_company_data(self):
         """Load and process company assessment data from CSV files.
@@ -420,27 +755,34 @@ class CompanyDataHandler(BaseDataHandler):
             Exception: If data loading fails
         """
         try:
-            DATA_DIR = get_latest_data_dir(FilePath(__file__).resolve().parent / "data")
-            print(f"Loading company data from directory: {DATA_DIR}")
+            DATA_DIR = find_data_dir()
+            logger.debug(f"Loading company data from directory: {DATA_DIR}")
 
             # Define the path for the company assessments CSV file.
             latest_file = get_latest_assessment_file(
                 "Company_Latest_Assessments*.csv", DATA_DIR
             )
-            print(f"Found latest company assessments file: {latest_file}")
+            logger.debug(f"Found latest company assessments file: {latest_file}")
 
             # Load the company dataset into a DataFrame.
-            company_df = pd.read_csv(latest_file)
-            print(f"Loaded {len(company_df)} company records")
+            company_df = self._read_csv(latest_file)
+            logger.debug(f"Loaded {len(company_df)} company records")
 
             # Standardize column names: strip extra spaces and convert to lowercase.
             company_df.columns = company_df.columns.str.strip().str.lower()
 
-            company_df["company name"] = company_df["company name"].apply(normalize_company_id)
+            company_df["company name"] = normalize_company_ids(company_df["company name"])
+            # Names are normalized above, so the lookup key is the name itself
+            company_df["_normalized_id"] = company_df["company name"]
+            # Parse MQ assessment dates once so requests only read the parsed values
+            company_df["_mq_dt"] = pd.to_datetime(
+                company_df["mq assessment date"], format="%d/%m/%Y", errors="coerce"
+            )
+            company_df["_mq_year"] = company_df["_mq_dt"].dt.year.astype("Int16")
 
-            return company_df
+            return self._categorize(self._downcast(company_df))
         except Exception as e:
-            print(f"Error in load_company_data: {str(e)}")
+            logger.error(f"Error in load_company_data: {str(e)}")
             raise
     
     def format_data(self, df: pd.DataFrame):
@@ -452,6 +794,12 @@ class CompanyDataHandler(BaseDataHandler):
         Returns:
             list: List of dictionaries containing formatted company data
         """
+        # Only convert the columns used below; missing optional ones become None.
+        columns = [
+            col
+            for col in ("company name", "sector", "geography", "latest assessment year")
+            if col in df.columns
+        ]
         # Map each row to a company dictionary with a normalized unique ID.
         companies = [
         {
@@ -461,7 +809,7 @@ class CompanyDataHandler(BaseDataHandler):
             "geography": row.get("geography", None),
             "latest_assessment_year": row.get("latest assessment year", None),
         }
-        for _, row in df.iterrows()
+        for row in df[columns].to_dict(orient="records")
         ]
         return companies
     
@@ -484,16 +832,8 @@ class CompanyDataHandler(BaseDataHandler):
         if len(history) < 2:
             return None
 
-        # Sort records by assessment date
-        history = history.copy()
-        history["assessment_year"] = history["mq assessment date"].apply(
-            lambda x: (
-                int(datetime.strptime(x, "%d/%m/%Y").year)
-                if pd.notna(x)
-                else None
-            )
-        )
-        history = history.sort_values(by="assessment_year", ascending=False)
+        # Sort records by the MQ assessment date parsed at load time
+        history = history.sort_values(by="_mq_dt", ascending=False)
         
         return history.iloc[0], history.iloc[1]
 
@@ -508,13 +848,5 @@ class CompanyDataHandler(BaseDataHandler):
             list: List of available assessment years
         """
         history = self.get_company_history(company_id)
-        available_years = []
-        
-        for date_str in history["mq assessment date"].dropna():
-            try:
-                dt = datetime.strptime(date_str, "%d/%m/%Y")
-                available_years.append(dt.year)
-            except (ValueError, TypeError):
-                continue
-                
-        return available_years
\ No newline at end of file
+        # Missing or invalid dates were parsed to NaT at load time
+        return history["_mq_year"].dropna().astype(int).tolist()
\ No newline at end of file
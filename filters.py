@@ -1,84 +1,137 @@
 """
 Filter models for API endpoints.
 
-This module provides Pydantic models for filtering data across different endpoints.
-These models are designed to be used with FastAPI's dependency injection system.
+This module provides the filter classes used across different endpoints.
+The query filters are plain, slotted dependency classes for FastAPI's dependency
+injection system: FastAPI validates their parameters as query parameters, so no
+model is validated again per request. The simple range filters are plain
+dataclasses, checked once on construction.
 """
+from dataclasses import dataclass
 from fastapi import Query
-from typing import Optional, Union, List
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Optional, List
 from datetime import datetime
 
-class RangeFilter(BaseModel):
-    """Base model for range-based filters."""
-    min: Optional[float] = Field(None, description="Minimum value")
-    max: Optional[float] = Field(None, description="Maximum value")
+@dataclass(slots=True)
+class RangeFilter:
+    """Filter for numeric ranges."""
+    min: Optional[float] = None
+    max: Optional[float] = None
 
-    @field_validator('min', 'max')
-    def validate_range(cls, v, values):
-        if v is not None and 'min' in values and 'max' in values:
-            if values['min'] is not None and values['max'] is not None:
-                if values['min'] > values['max']:
-                    raise ValueError("min must be less than or equal to max")
-        return v
+    def __post_init__(self):
+        if self.min is not None and self.max is not None and self.min > self.max:
+            raise ValueError("min must be less than or equal to max")
 
-class DateRangeFilter(BaseModel):
+@dataclass(slots=True)
+class DateRangeFilter:
     """Filter for date ranges."""
-    start_date: Optional[datetime] = Field(None, description="Start date")
-    end_date: Optional[datetime] = Field(None, description="End date")
-
-    @field_validator('start_date', 'end_date')
-    def validate_date_range(cls, v, values):
-        if v is not None and values.get('start_date') is not None and values.get('end_date') is not None:
-            if values['start_date'] > values['end_date']:
-                raise ValueError("start_date must be before or equal to end_date")
-        return v
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
+
+    def __post_init__(self):
+        if (
+            self.start_date is not None
+            and self.end_date is not None
+            and self.start_date > self.end_date
+        ):
+            raise ValueError("start_date must be before or equal to end_date")
     
-class CompanyFilters(BaseModel):
-    geography: Optional[str] = Field(
-        None,
-        description="Filter by geography",
-        json_schema_extra={"example": "United States of America"}
-    )
-    geography_code: Optional[str] = Field(
-        None,
-        description="Filter by geography code", 
-        json_schema_extra={"example": "USA"}
-    )
-    sector: Optional[str] = Field(
-        None,
-        description="Filter by sector",
-        json_schema_extra={"example": "Cement"}
-    )
-    ca100_focus_company: Optional[bool] = Field(
-        None,
-        description="Filter for CA100 focus companies",
-        json_schema_extra={"example": True}
-    )
-    large_medium_classification: Optional[str] = Field(
-        None,
-        description="Filter by company size classification",
-        json_schema_extra={"example": "Large"}
-    )
-    isins: Optional[Union[list[str], str]] = Field(
-        default=None,
-        description="Filter by ISIN identifiers",
-        json_schema_extra={"example": ["US0378331005", "GB00B03MLX29"]}
-    )
-    sedol: Optional[Union[list[str], str]] = Field(
-        default=None,
-        description="Filter by SEDOL identifiers",
-        json_schema_extra={"example": ["2000019", "B03MLX2"]}
+class CompanyFilters:
+    """Query parameters for filtering companies."""
+
+    __slots__ = (
+        "geography",
+        "geography_code",
+        "sector",
+        "ca100_focus_company",
+        "large_medium_classification",
+        "isins",
+        "sedol",
     )
 
+    def __init__(
+        self,
+        geography: Annotated[
+            Optional[str],
+            Query(description="Filter by geography", examples=["United States of America"]),
+        ] = None,
+        geography_code: Annotated[
+            Optional[str],
+            Query(description="Filter by geography code", examples=["USA"]),
+        ] = None,
+        sector: Annotated[
+            Optional[str],
+            Query(description="Filter by sector", examples=["Cement"]),
+        ] = None,
+        ca100_focus_company: Annotated[
+            Optional[bool],
+            Query(description="Filter for CA100 focus companies", examples=[True]),
+        ] = None,
+        large_medium_classification: Annotated[
+            Optional[str],
+            Query(description="Filter by company size classification", examples=["Large"]),
+        ] = None,
+        isins: Annotated[
+            Optional[List[str]],
+            Query(description="Filter by ISIN identifiers", examples=[["US0378331005", "GB00B03MLX29"]]),
+        ] = None,
+        sedol: Annotated[
+            Optional[List[str]],
+            Query(description="Filter by SEDOL identifiers", examples=[["2000019", "B03MLX2"]]),
+        ] = None,
+    ):
+        self.geography = geography
+        self.geography_code = geography_code
+        self.sector = sector
+        self.ca100_focus_company = ca100_focus_company
+        self.large_medium_classification = large_medium_classification
+        self.isins = isins
+        self.sedol = sedol
+
+
+class CPBenchmarkFilter:
+    """Query parameters for filtering CP benchmarks."""
+
+    __slots__ = ("benchmark_id",)
+
+    def __init__(
+        self,
+        benchmark_id: Annotated[
+            Optional[List[str]], Query(description="Filter by Benchmark_id")
+        ] = None,
+    ):
+        self.benchmark_id = benchmark_id
+
+class CPRegionalFilter:
+    """Query parameters for filtering regional CP benchmarks."""
+
+    __slots__ = ("regional_benchmark_id",)
+
+    def __init__(
+        self,
+        regional_benchmark_id: Annotated[
+            Optional[List[str]], Query(description="Filter by Regional Benchmark ID")
+        ] = None,
+    ):
+        self.regional_benchmark_id = regional_benchmark_id
 
-class CPBenchmarkFilter(BaseModel):
-    benchmark_id: Optional[List[str]] = Query(None, description="Filter by Benchmark_id")
+class MQFilter:
+    """Query parameters for filtering MQ assessments."""
 
-class CPRegionalFilter(BaseModel):
-    regional_benchmark_id:  Optional[List[str]] = Query(None, description="Filter by Regional Benchmark ID"),
+    __slots__ = ("mq_levels", "level", "assessment_year")
 
-class MQFilter(BaseModel):
-    mq_levels: Optional[List[int]] = Query(None, description="Filter by MQ Level")
-    level: Optional[List[int]] = Query(None, description="Filter by Overall Management Level")
-    assessment_year: Optional[int] = Query(None, description="Filter by assessment year")
\ No newline at end of file
+    def __init__(
+        self,
+        mq_levels: Annotated[
+            Optional[List[int]], Query(description="Filter by MQ Level")
+        ] = None,
+        level: Annotated[
+            Optional[List[int]], Query(description="Filter by Overall Management Level")
+        ] = None,
+        assessment_year: Annotated[
+            Optional[int], Query(description="Filter by assessment year")
+        ] = None,
+    ):
+        self.mq_levels = mq_levels
+        self.level = level
+        self.assessment_year = assessment_year
@@ -2,9 +2,12 @@
 """
 Centralized logging configuration for the TPI API.
 """
+import atexit
 import logging
-import sys
 import os
+import queue
+import sys
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener
 
 CP_DATA_DIR = os.getenv("CP_DATA_DIR", "data/")  # fallback if not set
 
@@ -12,24 +15,100 @@ CP_DATA_DIR = os.getenv("CP_DATA_DIR", "data/")  # fallback if not set
 LOG_FORMAT = "[%(asctime)s][%(levelname)s] %(name)s: %(message)s"
 DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
 
-# Configure the root logger
-root_logger = logging.getLogger()
-root_logger.setLevel(logging.INFO)
+# Records buffered before the log file is written (ERROR records are written
+# at once), and how often in seconds the running app flushes the buffer
+LOG_FILE_BUFFER_SIZE = 8192
+LOG_FLUSH_INTERVAL = 30
+
+# Set by configure_once; handlers are attached to the root logger only once
+_CONFIGURED = False
+buffered_file_handler = None
+log_listener = None
+
+class BatchedFileHandler(MemoryHandler):
+    """
+    Buffers records and writes them to its target file handler in one write.
+
+    MemoryHandler hands each buffered record to the target in turn, and the
+    file handler writes and flushes every one of them. This handler formats the
+    whole buffer first, so each flush costs one write to the log file.
+    """
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self.target and self.buffer:
+                target = self.target
+                records = [r for r in self.buffer if r.levelno >= target.level]
+                target.acquire()
+                try:
+                    if target.stream is None:
+                        target.stream = target._open()
+                    target.stream.write(
+                        "".join(target.format(r) + target.terminator for r in records)
+                    )
+                    target.stream.flush()
+                except Exception:
+                    target.handleError(self.buffer[-1])
+                finally:
+                    target.release()
+                self.buffer.clear()
+        finally:
+            self.release()
+
+def configure_once():
+    """
+    Configures the root logger, unless it has already been configured.
+    """
+    global _CONFIGURED, buffered_file_handler, log_listener
+    if _CONFIGURED:
+        return
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+
+    # Console handler
+    console_handler = logging.StreamHandler(stream=sys.stdout)
+    formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
+    console_handler.setFormatter(formatter)
+
+    file_handler = logging.FileHandler('tpi_api.log')
+    file_handler.setFormatter(formatter)
+    buffered_file_handler = BatchedFileHandler(
+        capacity=LOG_FILE_BUFFER_SIZE, flushLevel=logging.ERROR, target=file_handler
+    )
+
+    # Loggers only enqueue records; a background thread runs the handlers, so
+    # request handlers never wait on console or file writes
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    log_listener = QueueListener(
+        log_queue, console_handler, buffered_file_handler, respect_handler_level=True
+    )
+    log_listener.start()
 
-# Console handler 
-console_handler = logging.StreamHandler(stream=sys.stdout)
-formatter = logging.Formatter(LOG_FORMAT, datefmt=DATE_FORMAT)
-console_handler.setFormatter(formatter)
-root_logger.addHandler(console_handler)
+    atexit.register(_stop_logging)
+    _CONFIGURED = True
 
-file_handler = logging.FileHandler('tpi_api.log')
-file_handler.setFormatter(formatter)
-root_logger.addHandler(file_handler)
+def flush_logs():
+    """
+    Writes any buffered records to the log file.
+    """
+    if buffered_file_handler is not None:
+        buffered_file_handler.flush()
+
+def _stop_logging():
+    """
+    Handles the records still queued and writes them to the log file at exit.
+    """
+    log_listener.stop()
+    flush_logs()
 
 def get_logger(name: str) -> logging.Logger:
     """
     Gets a logger instance with the specified name.
     """
+    configure_once()
     return logging.getLogger(name)
 
 # Example usage (optional, just for testing this file)
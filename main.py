@@ -8,24 +8,25 @@ It integrates endpoints for:
 
 It also defines a basic root endpoint for a welcome message.
 """
-import time
+import asyncio
+import os
+from contextlib import asynccontextmanager, suppress
+from functools import lru_cache
+import orjson
+import pandas as pd
 from fastapi import FastAPI, APIRouter, Request, HTTPException, Response
 from slowapi.errors import RateLimitExceeded
 from middleware.rate_limiter import limiter, rate_limit_exceeded_handler
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import Response 
-from fastapi.responses import JSONResponse
-from fastapi.exceptions import HTTPException
+from middleware.logging_middleware import LoggingMiddleware
+from fastapi.responses import JSONResponse, ORJSONResponse
 from routes.ascor_routes import router as ascor_router
-from routes.company_routes import router as company_router
+from routes.company_routes import router as company_router, sample_router as sample_company_router
 from routes.cp_routes import cp_router
 from routes.mq_routes import mq_router
-from routes.cp_routes import cp_router
 from authentication.auth_router import router as auth_router
 from authentication.post_router import router as post_router
-from log_config import get_logger
-from services import fetch_company_data, CompanyNotFoundError, CompanyDataError
-from schemas import Metric, MetricSource, Indicator, IndicatorSource, Area, Pillar, CountryDataResponse
+from log_config import get_logger, flush_logs, LOG_FLUSH_INTERVAL
+from data_utils import find_data_dir
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -33,144 +34,87 @@ load_dotenv()
 logger = get_logger(__name__) # Get logger for main module
 
 # -------------------------------------------------------------------------
-# App Initialization
-app = FastAPI(
-    title="Transition Pathway Initiative API",
-    version="1.0",
-    description="Provides company, MQ, and CP assessments via REST endpoints.",
-)
-
-# Add limiter to app state
-app.state.limiter = limiter
-
-# Add rate limit exceeded handler
-app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
-
-# Add limiter to app state
-app.state.limiter = limiter
-
-# Add rate limit exceeded handler
-app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
-
-# --- Logging Middleware ---
-class LoggingMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
-        logger.info(f"START Request: {request.method} {request.url.path}")
-
-        response = None # Initialize response variable
-        try:
-            response = await call_next(request)
-        except Exception as e:
-            # Log unhandled exceptions originating from downstream
-            process_time = time.time() - start_time
-            logger.error(
-                f"ERROR Request: {request.method} {request.url.path} - "
-                f"Error: {e} - Time: {process_time:.4f}s"
-            )
-            # Reraise the exception to be handled by FastAPI's exception handlers
-            raise e # Or return a generic error response
-        finally:
-            process_time = time.time() - start_time
-            status_code = response.status_code if response else 500 # Get status code if response exists
-            logger.info(
-                f"END Request: {request.method} {request.url.path} - "
-                f"Status: {status_code} - Time: {process_time:.4f}s"
-            )
-        return response
-
-app.add_middleware(LoggingMiddleware)
-
-
-# --- Root Registration ---
-app.include_router(ascor_router, prefix="/v1")
-app.include_router(company_router, prefix="/v1/company")
-app.include_router(cp_router, prefix="/v1/cp")
-app.include_router(mq_router, prefix="/v1/mq")
-
-# Add company routes for testing the fetch_company_data function
-sample_company_router = APIRouter(prefix="/companies", tags=["Sample Company Endpoints"])
-app.include_router(sample_company_router, prefix="/v1")
-
-@company_router.get("/")
-async def get_companies():
-    """Get a list of sample companies."""
+# Startup
+async def flush_logs_periodically():
+    """Write buffered log records to the log file every LOG_FLUSH_INTERVAL seconds."""
+    while True:
+        await asyncio.sleep(LOG_FLUSH_INTERVAL)
+        # The flush writes to the log file, so keep it off the event loop
+        await asyncio.to_thread(flush_logs)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the OpenAPI schema once per worker at startup. FastAPI caches it on
+    # the app, so the first /docs or /openapi.json request no longer pays for it.
+    app.openapi()
+    # Parse the sector CSV off the event loop before serving, so the first
+    # request to /sectors/company-assessments is served from the cache
     try:
-        logger.info("Fetching list of sample companies")
-        # Create sample company data
-        companies = [
-            {"id": 1, "name": "Company 1"},
-            {"id": 2, "name": "Company 2"},
-            {"id": 3, "name": "Company 3"},
-            {"id": 42, "name": "Company 42"},
-            {"id": 100, "name": "Company 100"}
-        ]
-        logger.info(f"Successfully retrieved {len(companies)} sample companies")
-        return {"companies": companies}
+        await asyncio.to_thread(load_sector_file)
     except Exception as e:
-        logger.exception(f"Error retrieving company list: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
-@company_router.get("/{company_id}")
-async def get_company(company_id: int):
-    try:
-        logger.info(f"Processing request for company ID: {company_id}")
-        result = fetch_company_data(company_id)
-        return result
-    except CompanyNotFoundError as e:
-        logger.error(f"Company not found: {e}")
-        raise HTTPException(status_code=404, detail=str(e))
-    except CompanyDataError as e:
-        logger.error(f"Error processing company data: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-    except Exception as e:
-        logger.exception(f"Unexpected error: {e}")
-        raise HTTPException(status_code=500, detail="An unexpected error occurred")
-
-app.include_router(company_router, prefix="/v1")
+        # A missing or malformed file only affects the sector endpoint
+        logger.warning("Sector data not preloaded: %s", e)
+    flush_task = asyncio.create_task(flush_logs_periodically())
+    yield
+    flush_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await flush_task
+    await asyncio.to_thread(flush_logs)
 
 # Add sector data routes for demonstrating logging with real data files
 sector_router = APIRouter(prefix="/sectors", tags=["Sector Endpoints"])
 
+SECTOR_FILE = os.getenv("SECTOR_FILE") or str(
+    find_data_dir() / "Company_Latest_Assessments.csv"
+)
+
+@lru_cache(maxsize=4)
+def _load_sector(path, mtime):
+    """
+    Return the record count and a five-record sample of a sector CSV.
+
+    The file's modification time is part of the cache key, so the file is
+    parsed again only when it changes on disk.
+    """
+    df = pd.read_csv(path, engine="pyarrow")
+    return len(df), df.head(5).to_dict(orient="records")
+
+def load_sector_file(path=SECTOR_FILE):
+    """
+    Return the cached record count and sample for the current version of a sector CSV.
+    """
+    return _load_sector(path, os.path.getmtime(path))
+
 @sector_router.get("/company-assessments")
 async def get_sector_company_assessments():
     try:
-        sector_file = "/Users/rishisiddharth/Desktop/LSE_2024_2045/classes/DS205W/Summative1_logging/tpi_apis/data/TPI_sector_data_All_sectors_08032025/Company_Latest_Assessments.csv"
-        logger.info(f"Loading sector company assessments from {sector_file}")
+        logger.info(f"Loading sector company assessments from {SECTOR_FILE}")
         
-        # Use pandas to read the CSV file
-        import pandas as pd
-        df = pd.read_csv(sector_file)
-        
-        # Get the first 5 records for a sample
-        sample_data = df.head(5).to_dict(orient="records")
-        logger.info(f"Successfully loaded {len(df)} company assessments, returning sample of 5")
+        # The CSV is parsed at startup and again only when the file changes;
+        # that parse runs in a worker thread so it never blocks the event loop
+        total_records, sample_data = await asyncio.to_thread(load_sector_file)
+        logger.info(f"Successfully loaded {total_records} company assessments, returning sample of 5")
         
         return {
-            "total_records": len(df),
+            "total_records": total_records,
             "sample_data": sample_data
         }
     except Exception as e:
         logger.exception(f"Error loading sector data: {e}")
         raise HTTPException(status_code=500, detail=f"Error loading sector data: {str(e)}")
 
-app.include_router(sector_router, prefix="/v1")
-app.include_router(auth_router, prefix="/v1")
-app.include_router(post_router, prefix="/v1")
-
-# ... other routers go here
-
 # --- Root Endpoint ---
-@app.get("/")
+# The welcome message never changes, so it is serialised once at import time
+HOME_BODY = orjson.dumps({"message": "Welcome to the TPI API!"})
+
 @limiter.limit("100/minute")
 async def home(request: Request):
     """
     Root endpoint that returns a welcome message.
     """
-    return {"message": "Welcome to the TPI API!"}
+    return Response(content=HOME_BODY, media_type="application/json")
 
 # Global exception handler for more structured error logging
-@app.exception_handler(Exception)
 async def generic_exception_handler(request: Request, exc: Exception):
     # Log the exception details here before returning the response
     logger.error(f"Unhandled Exception for {request.method} {request.url.path}: {exc}", exc_info=True) # exc_info=True adds traceback
@@ -178,3 +122,47 @@ async def generic_exception_handler(request: Request, exc: Exception):
         status_code=500,
         content={"message": "An internal server error occurred."},
     )
+
+# -------------------------------------------------------------------------
+# App Initialization
+def create_app() -> FastAPI:
+    """
+    Builds the FastAPI application with its middleware, routers and handlers.
+    """
+    app = FastAPI(
+        title="Transition Pathway Initiative API",
+        version="1.0",
+        description="Provides company, MQ, and CP assessments via REST endpoints.",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
+
+    # Add limiter to app state
+    app.state.limiter = limiter
+
+    # Add rate limit exceeded handler and the global exception handler
+    app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)
+    app.add_exception_handler(Exception, generic_exception_handler)
+
+    # --- Logging Middleware ---
+    app.add_middleware(LoggingMiddleware)
+
+    # --- Root Registration ---
+    app.include_router(ascor_router, prefix="/v1")
+    app.include_router(company_router, prefix="/v1/company")
+    # Company details are also served at /v1/company/{company_id}
+    app.include_router(company_router, prefix="/v1")
+    app.include_router(sample_company_router, prefix="/v1")
+    app.include_router(cp_router, prefix="/v1/cp")
+    app.include_router(mq_router, prefix="/v1/mq")
+    app.include_router(sector_router, prefix="/v1")
+    app.include_router(auth_router, prefix="/v1")
+    app.include_router(post_router, prefix="/v1")
+
+    # ... other routers go here
+
+    app.add_api_route("/", home, methods=["GET"])
+    return app
+
+# The application served by `uvicorn main:app`
+app = create_app()
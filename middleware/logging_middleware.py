@@ -0,0 +1,57 @@
+"""
+This module provides the request logging middleware for the FastAPI app.
+"""
+
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from log_config import get_logger
+
+logger = get_logger(__name__)
+
+class LoggingMiddleware:
+    """
+    Logs the start, end, status and duration of every request.
+
+    This is a plain ASGI middleware rather than a BaseHTTPMiddleware, so
+    responses are passed straight through instead of being streamed through a
+    task group and memory stream on every request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Monotonic clock, so durations are unaffected by wall-clock adjustments
+        start_ns = time.perf_counter_ns()
+        # Messages use %-style arguments, so they are only formatted if logged
+        method, path = scope["method"], scope["path"]
+        logger.info("START Request: %s %s", method, path)
+
+        status_code = 500 # Reported if no response is started
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as e:
+            # Log unhandled exceptions originating from downstream
+            process_time = (time.perf_counter_ns() - start_ns) / 1e9
+            logger.error(
+                "ERROR Request: %s %s - Error: %s - Time: %.4fs",
+                method, path, e, process_time,
+            )
+            # Reraise the exception to be handled by FastAPI's exception handlers
+            raise
+        finally:
+            process_time = (time.perf_counter_ns() - start_ns) / 1e9
+            logger.info(
+                "END Request: %s %s - Status: %s - Time: %.4fs",
+                method, path, status_code, process_time,
+            )
@@ -2,11 +2,10 @@
 This module provides the rate limiter for the FastAPI. It also creates the limit exceeded error handler.
 """
 
-from fastapi import Request, HTTPException, Response
+from fastapi import Request
 from fastapi.responses import JSONResponse
 from slowapi import Limiter
 from slowapi.util import get_remote_address
-from slowapi.middleware import SlowAPIMiddleware
 from slowapi.errors import RateLimitExceeded
 
 # Initialize limiter
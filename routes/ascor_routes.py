@@ -1,7 +1,6 @@
-import os
 import pandas as pd
 
-from fastapi import APIRouter, HTTPException, FastAPI, Request, Depends 
+from fastapi import APIRouter, HTTPException, Request
 from schemas import CountryDataResponse
 from services import CountryDataProcessor
 from middleware.rate_limiter import limiter
@@ -16,7 +15,7 @@ filepath = "./data/TPI_ASCOR_data_13012025/ASCOR_assessments_results.xlsx"
 # Try to load the data, or create a mock dataframe if the file is missing
 try:
     logger.info(f"Attempting to load data from {filepath}")
-    df_assessments = pd.read_excel(filepath, engine='openpyxl')
+    df_assessments = pd.read_excel(filepath, engine='calamine', sheet_name=0)
     logger.info(f"Successfully loaded data from {filepath}")
 except FileNotFoundError as e:
     logger.warning(f"Data file not found: {e}. Creating mock data instead.")
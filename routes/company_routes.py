@@ -10,8 +10,6 @@ and comparing performance between assessment cycles.
 # -------------------------------------------------------------------------
 from fastapi import APIRouter, HTTPException, Query, Request, Depends
 import pandas as pd
-from pathlib import Path as FilePath
-from datetime import datetime
 from typing import Union
 from middleware.rate_limiter import limiter
 from schemas import (
@@ -25,6 +23,13 @@ from schemas import (
 from utils import normalize_company_id
 from data_utils import CompanyDataHandler
 from filters import CompanyFilters
+from log_config import get_logger
+from services import fetch_company_data, CompanyNotFoundError, CompanyDataError
+
+logger = get_logger(__name__)
+
+# Errors fetch_company_data raises for a known company ID problem
+COMPANY_ERRORS = (CompanyNotFoundError, CompanyDataError)
 
 # -------------------------------------------------------------------------
 # Router Initialization
@@ -67,7 +72,7 @@ async def get_all_companies(
     
     try:
         total_companies = company_handler.get_df_length()
-        paginated_data = company_handler.paginate(company_df, page, per_page)
+        paginated_data = company_handler.get_page(page, per_page)
         companies = company_handler.format_data(paginated_data)
     except Exception as e:
         raise HTTPException(
@@ -163,9 +168,7 @@ async def get_company_history(request: Request, company_id: str, filter: Company
             detail="Column 'MQ Assessment Date' not found in dataset. Check CSV structure.",
         )
 
-    history = filtered_df[
-    filtered_df["company name"].apply(normalize_company_id) == normalized_input
-    ]
+    history = company_handler.get_company_history(normalized_input)
 
     if history.empty:
         raise HTTPException(
@@ -173,32 +176,37 @@ async def get_company_history(request: Request, company_id: str, filter: Company
             detail=f"No history found for company '{company_id}'."
         )
 
+    def column(name, default):
+        """Return a column as a NumPy array, or the default for every row."""
+        if name in history.columns:
+            return history[name].to_numpy()
+        return [default] * len(history)
+
+    # Dates are parsed at load time; missing or invalid dates give None.
+    years = [int(year) if pd.notna(year) else None for year in history["_mq_year"]]
+
     return CompanyHistoryResponse(
         company_id=normalized_input,
         history=[
             CompanyDetail(
                 company_id=normalized_input,
-                name=row.get("company name", "N/A"),
-                sector=row.get("sector", "N/A"),
-                geography=row.get("geography", "N/A"),
-                # Convert the assessment date to an integer year; use a default if not present.
-                latest_assessment_year=(
-                    int(
-                        datetime.strptime(
-                            row.get("mq assessment date", "01/01/1900"),
-                            "%d/%m/%Y",
-                        ).year
-                    )
-                    if pd.notna(row.get("mq assessment date"))
-                    else None
-                ),
-                management_quality_score=row.get("level", None),
-                carbon_performance_alignment_2035=str(
-                    row.get("carbon performance alignment 2035", "N/A")
-                ),  # Ensuring string conversion
-                emissions_trend=row.get("performance compared to previous year", "Unknown"),
+                name=name,
+                sector=sector,
+                geography=geography,
+                latest_assessment_year=year,
+                management_quality_score=level,
+                carbon_performance_alignment_2035=str(alignment),  # Ensuring string conversion
+                emissions_trend=trend,
+            )
+            for name, sector, geography, year, level, alignment, trend in zip(
+                column("company name", "N/A"),
+                column("sector", "N/A"),
+                column("geography", "N/A"),
+                years,
+                column("level", None),
+                column("carbon performance alignment 2035", "N/A"),
+                column("performance compared to previous year", "Unknown"),
             )
-            for _, row in history.iterrows()
         ],
     )
 
@@ -257,13 +265,53 @@ async def compare_company_performance(request: Request, company_id: str, filter:
     
     return PerformanceComparisonResponse(
         company_id=normalized_input,
-        current_year=latest["assessment_year"],
-        previous_year=previous["assessment_year"],
+        current_year=latest["_mq_year"],
+        previous_year=previous["_mq_year"],
         latest_mq_score=float(latest.get("level")) if pd.notna(latest.get("level")) else None,
         previous_mq_score=float(previous.get("level")) if pd.notna(previous.get("level")) else None,
         latest_cp_alignment=str(latest.get("carbon performance alignment 2035", "N/A")),
         previous_cp_alignment=str(previous.get("carbon performance alignment 2035", "N/A")),
     )
-        
 
 
+# ------------------------------------------------------------------------------
+# Endpoints: GET /companies/ and GET /companies/{company_id} - Sample Companies
+# ------------------------------------------------------------------------------
+# Sample routes for exercising fetch_company_data, kept on their own router so
+# they never shadow the company endpoints above
+sample_router = APIRouter(prefix="/companies", tags=["Sample Company Endpoints"])
+
+@sample_router.get("/")
+async def get_companies():
+    """Get a list of sample companies."""
+    try:
+        logger.info("Fetching list of sample companies")
+        # Create sample company data
+        companies = [
+            {"id": 1, "name": "Company 1"},
+            {"id": 2, "name": "Company 2"},
+            {"id": 3, "name": "Company 3"},
+            {"id": 42, "name": "Company 42"},
+            {"id": 100, "name": "Company 100"}
+        ]
+        logger.info(f"Successfully retrieved {len(companies)} sample companies")
+        return {"companies": companies}
+    except Exception as e:
+        logger.exception(f"Error retrieving company list: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+@sample_router.get("/{company_id}")
+async def get_company(company_id: int):
+    try:
+        logger.info("Processing request for company ID: %s", company_id)
+        result = fetch_company_data(company_id)
+        return result
+    except COMPANY_ERRORS as e:
+        if isinstance(e, CompanyNotFoundError):
+            logger.error("Company not found: %s", e)
+            raise HTTPException(status_code=404, detail=str(e))
+        logger.error("Error processing company data: %s", e)
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception:
+        logger.error("Unexpected error for company %s", company_id, exc_info=True)
+        raise HTTPException(status_code=500, detail="An unexpected error occurred")
@@ -8,12 +8,9 @@ loads and normalizes the data, and exposes endpoints to retrieve and compare CP
 # Imports
 # -------------------------------------------------------------------------
 from data_utils import CPHandler
-from fastapi import APIRouter, HTTPException, Query, Path, Request, Depends
-import pandas as pd
+from fastapi import APIRouter, HTTPException, Query, Request, Depends
 import os
-from pathlib import Path as FilePath
-from datetime import datetime
-from typing import List, Optional, Dict, Union
+from typing import List, Dict, Union
 from middleware.rate_limiter import limiter
 from schemas import (
     CPAssessmentDetail,
@@ -49,10 +46,10 @@ async def get_latest_cp_assessments(
     Retrieve the latest CP assessment levels for all companies with pagination.
 
     Steps:
-    1. Sort the DataFrame by 'assessment date'.
-    2. Group by 'company name' and select the latest record for each.
-    3. Apply pagination based on page/page_size.
-    4. Return a list of CPAssessmentDetail objects.
+    1. Group by 'company name' and select the record with the latest
+       parsed 'assessment date' for each, ordered by that date.
+    2. Apply pagination based on page/page_size.
+    3. Return a list of CPAssessmentDetail objects.
     """
     cp_handler = CPHandler(prefix=CP_DATA_DIR)
     try:
@@ -70,13 +67,13 @@ async def get_latest_cp_assessments(
             name=row["company name"],
             sector=row.get("sector", "N/A"),
             geography=row.get("geography", "N/A"),
-            latest_assessment_year=pd.to_datetime(row["assessment date"]).year,
+            latest_assessment_year=row["_assessment_dt"].year,
             carbon_performance_2025=row.get("carbon performance 2025", "N/A"),
             carbon_performance_2027=row.get("carbon performance 2027", "N/A"),
             carbon_performance_2035=row.get("carbon performance 2035", "N/A"),
             carbon_performance_2050=row.get("carbon performance 2050", "N/A"),
         )
-        for _, row in latest_records.iterrows()
+        for row in latest_records.to_dict(orient="records")
     ]
 
     return results
@@ -115,13 +112,13 @@ async def get_company_cp_history(request: Request, company_id: str, filter: Comp
             name=row["company name"],
             sector=row.get("sector", "N/A"),
             geography=row.get("geography", "N/A"),
-            latest_assessment_year=pd.to_datetime(row["assessment date"],dayfirst=True).year,
+            latest_assessment_year=row["_assessment_dt"].year,
             carbon_performance_2025=row.get("carbon performance 2025", "N/A"),
             carbon_performance_2027=row.get("carbon performance 2027", "N/A"),
             carbon_performance_2035=row.get("carbon performance 2035", "N/A"),
             carbon_performance_2050=row.get("carbon performance 2050", "N/A"),
         )
-        for _, row in company_history.iterrows()
+        for row in company_history.to_dict(orient="records")
     ]
 
 
@@ -194,8 +191,8 @@ async def compare_company_cp(request: Request, company_id: str, filter: CompanyF
         latest, previous = company_data
         return CPComparisonResponse(
             company_id=company_id,
-            current_year=pd.to_datetime(latest["assessment date"], dayfirst=True).year,
-            previous_year=pd.to_datetime(previous["assessment date"], dayfirst=True).year,
+            current_year=latest["_assessment_dt"].year,
+            previous_year=previous["_assessment_dt"].year,
             latest_cp_2025=latest.get("carbon performance 2025", "N/A"),
             previous_cp_2025=previous.get("carbon performance 2025", "N/A"),
             latest_cp_2035=latest.get("carbon performance 2035", "N/A"),
@@ -9,49 +9,27 @@ and exposes endpoints for fetching the latest assessments, assessments by method
 # ------------------------------------------------------------------------------
 # Imports
 # ------------------------------------------------------------------------------
-import re
 from fastapi import APIRouter, HTTPException, Query, Path, Depends, Request
 import pandas as pd
-from pathlib import Path as FilePath
-from datetime import datetime
-from typing import List, Optional
 from middleware.rate_limiter import limiter
 from schemas import (
     MQAssessmentDetail,
-    MQIndicatorsResponse,
     PaginatedMQResponse,
 )
-from data_utils import MQHandler
+from data_utils import MQHandler, find_mq_files
 from filters import CompanyFilters, MQFilter
-from utils import get_latest_data_dir, get_latest_assessment_file
 
 # ------------------------------------------------------------------------------
 # Constants and Data Loading
 # ------------------------------------------------------------------------------
-BASE_DIR = FilePath(__file__).resolve().parent.parent
-BASE_DATA_DIR = BASE_DIR / "data"
-DATA_DIR = get_latest_data_dir(BASE_DATA_DIR)
+# MQ files are discovered once and shared with MQHandler
+mq_files = find_mq_files()
 
-STAR_MAPPING = {
-    "0STAR": 0.0,
-    "1STAR": 1.0,
-    "2STAR": 2.0,
-    "3STAR": 3.0,
-    "4STAR": 4.0,
-    "5STAR": 5.0,
-}
 
-mq_files = sorted(DATA_DIR.glob("MQ_Assessments_Methodology_*.csv"))
-if not mq_files:
-    raise FileNotFoundError(f"No MQ datasets found in {DATA_DIR}")
-
-mq_df_list = [pd.read_csv(f) for f in mq_files]
-
-for idx, df in enumerate(mq_df_list, start=1):
-    df["methodology_cycle"] = idx
-
-mq_df = pd.concat(mq_df_list, ignore_index=True)
-mq_df.columns = mq_df.columns.str.strip().str.lower()
+def _mq_score(row):
+    """Return the precomputed STAR score of a row, or None if it has none."""
+    score = row["_mq_score"]
+    return None if pd.isna(score) else score
 
 # ------------------------------------------------------------------------------
 # Router Initialization
@@ -76,10 +54,11 @@ async def get_latest_mq_assessments(
     Fetches the latest Management Quality (MQ) assessment for all companies with pagination.
 
     This function:
-    1. Sorts the full MQ dataset by the 'assessment date'.
-    2. Groups the data by 'company name' and selects the latest record for each company.
+    1. Groups the MQ dataset by 'company name' and selects the record with the
+       latest parsed 'assessment date' for each company.
+    2. Orders the latest records by assessment date.
     3. Applies pagination based on the provided page and page_size parameters.
-    4. Maps STAR rating strings to numeric scores using a pre-defined dictionary.
+    4. Reads the numeric STAR score precomputed when the data is loaded.
     """
     mq_handler = MQHandler()
 
@@ -104,14 +83,10 @@ async def get_latest_mq_assessments(
             name=row["company name"],
             sector=row.get("sector", "N/A"),
             geography=row.get("geography", "N/A"),
-            latest_assessment_year=pd.to_datetime(
-                row["assessment date"], format="%d/%m/%Y"
-            ).year,
-            management_quality_score=STAR_MAPPING.get(
-                row.get("level", "N/A"), None
-            ),
+            latest_assessment_year=row["_assessment_dt"].year,
+            management_quality_score=_mq_score(row),
         )
-        for _, row in latest_records.iterrows()
+        for row in latest_records.to_dict(orient="records")
     ]
 
     return PaginatedMQResponse(
@@ -161,10 +136,10 @@ def get_mq_by_methodology(
     total_records = len(methodology_data)
 
     results = []
-    for _, row in paginated_data.iterrows():
-        try:
-            year = pd.to_datetime(row["assessment date"], format="%d/%m/%Y").year
-        except Exception:
+    for row in paginated_data.to_dict(orient="records"):
+        # Dates are parsed at load time; unparseable ones are missing (NaT or "N/A")
+        assessment_dt = row["_assessment_dt"]
+        if not isinstance(assessment_dt, pd.Timestamp):
             raise HTTPException(
                 status_code=422,
                 detail=f"Invalid date format for company: {row.get('company name')}"
@@ -175,8 +150,8 @@ def get_mq_by_methodology(
             name=row["company name"],
             sector=row.get("sector", "N/A"),
             geography=row.get("geography", "N/A"),
-            latest_assessment_year=year,
-            management_quality_score=STAR_MAPPING.get(row.get("level", "N/A"), None),
+            latest_assessment_year=assessment_dt.year,
+            management_quality_score=_mq_score(row),
         ))
 
     return PaginatedMQResponse(
@@ -232,14 +207,10 @@ async def get_mq_trends_sector(
             name=row["company name"],
             sector=sector_id,
             geography=row.get("geography", "N/A"),
-            latest_assessment_year=pd.to_datetime(
-                row["assessment date"], format="%d/%m/%Y"
-            ).year,
-            management_quality_score=STAR_MAPPING.get(
-                row.get("level", "N/A"), None
-            ),
+            latest_assessment_year=row["_assessment_dt"].year,
+            management_quality_score=_mq_score(row),
         )
-        for _, row in paginated_data.iterrows()
+        for row in paginated_data.to_dict(orient="records")
     ]
 
     return PaginatedMQResponse(
@@ -7,8 +7,8 @@ between the route handlers and data access.
 See: https://lse-dsi.github.io/DS205/2024-2025/winter-term/weeks/week02/slides.html#/key-concepts
 """
 
+from functools import lru_cache
 import pandas as pd
-from fastapi import APIRouter, HTTPException
 from log_config import get_logger
 from schemas import Metric, MetricSource, Indicator, IndicatorSource, Area, Pillar, CountryDataResponse
 
@@ -123,10 +123,15 @@ class CompanyDataError(Exception):
     """Custom exception for errors during company data processing."""
     pass
 
+@lru_cache(maxsize=1024)
 def fetch_company_data(company_id: int) -> dict:
     """
     Fetches (simulated) company data by ID.
 
+    Company data does not change while the app is running, so results are cached
+    per ID; errors are not cached. Call fetch_company_data.cache_clear() after
+    reloading the data.
+
     Args:
         company_id: The ID of the company to fetch.
 
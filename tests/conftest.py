@@ -1024,22 +1024,33 @@ def expected_latest_cp_reponse():
     """Expected response structure for latest CP assessment endpoint using page 1 and 10 results per page as example"""
     return [
         {
-            "company_id": "Vectren",
-            "name": "Vectren",
-            "sector": "Electricity Utilities",
-            "geography": "United States of America",
-            "latest_assessment_year": 2019,
+            "company_id": "Fibria",
+            "name": "Fibria",
+            "sector": "Paper",
+            "geography": "Brazil",
+            "latest_assessment_year": 2018,
             "carbon_performance_2025": "N/A",
             "carbon_performance_2027": "N/A",
             "carbon_performance_2035": "N/A",
             "carbon_performance_2050": "N/A"
         },
         {
-            "company_id": "Innogy",
-            "name": "Innogy",
-            "sector": "Electricity Utilities",
-            "geography": "Germany",
-            "latest_assessment_year": 2019,
+            "company_id": "Pap Y Cart Euro",
+            "name": "Pap Y Cart Euro",
+            "sector": "Paper",
+            "geography": "Spain",
+            "latest_assessment_year": 2018,
+            "carbon_performance_2025": "N/A",
+            "carbon_performance_2027": "N/A",
+            "carbon_performance_2035": "N/A",
+            "carbon_performance_2050": "N/A"
+        },
+        {
+            "company_id": "UC RUSAL",
+            "name": "UC RUSAL",
+            "sector": "Aluminium",
+            "geography": "Hong Kong",
+            "latest_assessment_year": 2018,
             "carbon_performance_2025": "N/A",
             "carbon_performance_2027": "N/A",
             "carbon_performance_2035": "N/A",
@@ -1057,77 +1068,66 @@ def expected_latest_cp_reponse():
             "carbon_performance_2050": "N/A"
         },
         {
-            "company_id": "Inner Mongolia Yili Industrial",
-            "name": "Inner Mongolia Yili Industrial",
-            "sector": "Food Producers",
-            "geography": "China",
-            "latest_assessment_year": 2024,
+            "company_id": "Innogy",
+            "name": "Innogy",
+            "sector": "Electricity Utilities",
+            "geography": "Germany",
+            "latest_assessment_year": 2019,
             "carbon_performance_2025": "N/A",
             "carbon_performance_2027": "N/A",
             "carbon_performance_2035": "N/A",
             "carbon_performance_2050": "N/A"
         },
         {
-            "company_id": "Orkla",
-            "name": "Orkla",
-            "sector": "Food Producers",
-            "geography": "Norway",
-            "latest_assessment_year": 2024,
+            "company_id": "Vectren",
+            "name": "Vectren",
+            "sector": "Electricity Utilities",
+            "geography": "United States of America",
+            "latest_assessment_year": 2019,
             "carbon_performance_2025": "N/A",
             "carbon_performance_2027": "N/A",
             "carbon_performance_2035": "N/A",
             "carbon_performance_2050": "N/A"
         },
         {
-            "company_id": "Freshpet",
-            "name": "Freshpet",
-            "sector": "Food Producers",
+            "company_id": "Arconic",
+            "name": "Arconic",
+            "sector": "Aluminium",
             "geography": "United States of America",
-            "latest_assessment_year": 2024,
+            "latest_assessment_year": 2019,
             "carbon_performance_2025": "N/A",
             "carbon_performance_2027": "N/A",
             "carbon_performance_2035": "N/A",
             "carbon_performance_2050": "N/A"
         },
         {
-            "company_id": "NH Foods",
-            "name": "NH Foods",
-            "sector": "Food Producers",
+            "company_id": "Nisshin Steel",
+            "name": "Nisshin Steel",
+            "sector": "Steel",
             "geography": "Japan",
-            "latest_assessment_year": 2024,
+            "latest_assessment_year": 2019,
             "carbon_performance_2025": "N/A",
             "carbon_performance_2027": "N/A",
             "carbon_performance_2035": "N/A",
             "carbon_performance_2050": "N/A"
         },
         {
-            "company_id": "Ingredion",
-            "name": "Ingredion",
-            "sector": "Food Producers",
+            "company_id": "Concho Resources",
+            "name": "Concho Resources",
+            "sector": "Oil & Gas",
             "geography": "United States of America",
-            "latest_assessment_year": 2024,
-            "carbon_performance_2025": "N/A",
-            "carbon_performance_2027": "N/A",
-            "carbon_performance_2035": "N/A",
-            "carbon_performance_2050": "N/A"
-        },
-        {
-            "company_id": "Yakult Honsha",
-            "name": "Yakult Honsha",
-            "sector": "Food Producers",
-            "geography": "Japan",
-            "latest_assessment_year": 2024,
+            "latest_assessment_year": 2020,
             "carbon_performance_2025": "N/A",
             "carbon_performance_2027": "N/A",
             "carbon_performance_2035": "N/A",
             "carbon_performance_2050": "N/A"
         },
         {
-            "company_id": "Foshan Haitian Flavouring and Food",
-            "name": "Foshan Haitian Flavouring and Food",
-            "sector": "Food Producers",
-            "geography": "China",
-            "latest_assessment_year": 2024,
+            "company_id": "Noble Energy",
+            "name": "Noble Energy",
+            "sector": "Oil & Gas",
+            "geography": "United States of America",
+            "latest_assessment_year": 2020,
             "carbon_performance_2025": "N/A",
             "carbon_performance_2027": "N/A",
             "carbon_performance_2035": "N/A",
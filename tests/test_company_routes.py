@@ -19,6 +19,33 @@ def test_get_all_companies():
     assert "per_page" in data
     assert "companies" in data
 
+def test_get_all_companies_page_with_missing_values():
+    """Test that a page containing companies with missing MQ dates is still served."""
+    response = client.get("/v1/company/companies?page=8&per_page=100")
+    assert response.status_code == 200
+    assert len(response.json()["companies"]) == 100
+
+def test_get_all_companies_filtered_by_isin_query():
+    """Test that ISINs are read from the query string and filter the companies."""
+    response = client.get("/v1/company/companies?isins=US88579Y1010")
+    assert response.status_code == 200
+    assert response.json()["total"] == 1
+
+def test_get_company_details_by_short_path():
+    """Test that /v1/company/{company_id} returns the same details as /v1/company/company/{company_id}."""
+    response = client.get("/v1/company/3m")
+    assert response.status_code == 200
+    assert response.json() == client.get("/v1/company/company/3m").json()
+
+def test_get_sample_companies():
+    """Test that the sample company endpoints live under /v1/companies/."""
+    response = client.get("/v1/companies/")
+    assert response.status_code == 200
+    assert len(response.json()["companies"]) == 5
+    response = client.get("/v1/companies/42")
+    assert response.status_code == 200
+    assert response.json() == {"id": 42, "name": "Company 42"}
+
 def test_get_company_details_not_found():
     """Test the company details endpoint returns 404 for a non-existent company."""
     response = client.get("/v1/company/company/nonexistent_company")
@@ -0,0 +1,44 @@
+# tests/test_data_utils.py
+import pandas as pd
+import data_utils
+from data_utils import BaseDataHandler
+
+
+# ------------------------------------------------------------------------------
+# Tests for the Parquet cache of BaseDataHandler._read_csv
+# ------------------------------------------------------------------------------
+def _write_csv(tmp_path):
+    csv_path = tmp_path / "Sample_01012025.csv"
+    pd.DataFrame({"company name": ["A", "B"], "level": [1, 2]}).to_csv(csv_path, index=False)
+    return csv_path
+
+
+def test_read_csv_writes_parquet_cache(tmp_path, monkeypatch):
+    """Test that the first read leaves exactly one complete Parquet copy behind."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(data_utils, "PARQUET_CACHE_DIR", cache_dir)
+    csv_path = _write_csv(tmp_path)
+    cache_dir.mkdir()
+    (cache_dir / "Sample_01012025-1-1.parquet").write_bytes(b"old")
+
+    df = BaseDataHandler()._read_csv(csv_path)
+
+    assert df["company name"].tolist() == ["A", "B"]
+    cached = list(cache_dir.iterdir())
+    assert len(cached) == 1
+    assert pd.read_parquet(cached[0]).equals(pd.read_csv(csv_path, engine="pyarrow"))
+
+
+def test_read_csv_treats_corrupt_cache_as_miss(tmp_path, monkeypatch):
+    """Test that a truncated Parquet copy is replaced instead of failing the load."""
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(data_utils, "PARQUET_CACHE_DIR", cache_dir)
+    csv_path = _write_csv(tmp_path)
+    BaseDataHandler()._read_csv(csv_path)
+    (cache_path,) = cache_dir.iterdir()
+    cache_path.write_bytes(b"PAR1")
+
+    df = BaseDataHandler()._read_csv(csv_path)
+
+    assert df["level"].tolist() == [1, 2]
+    assert pd.read_parquet(cache_path)["level"].tolist() == [1, 2]
@@ -1,6 +1,7 @@
 # tests/test_helpers.py
 import re
 import pytest
+import pandas as pd
 from datetime import datetime
 from pathlib import Path
 from utils import (
@@ -8,6 +9,7 @@ from utils import (
     get_latest_assessment_file,
     get_latest_cp_file,
     normalize_company_id,
+    normalize_company_ids,
 )
 
 
@@ -122,3 +124,10 @@ def test_normalize_company_id_with_punctuation():
     """
     assert normalize_company_id("Johnson & Johnson") == "johnson_&_johnson"
     assert normalize_company_id("3M.Co") == "3m.co"
+
+
+def test_normalize_company_ids_matches_scalar_version():
+    """Ensure the vectorized normalization gives the same IDs as the scalar one."""
+    names = ["  3M  ", "Apple Inc", "Johnson & Johnson", "3M.Co", "   "]
+    result = normalize_company_ids(pd.Series(names))
+    assert result.tolist() == [normalize_company_id(name) for name in names]
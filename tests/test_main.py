@@ -33,4 +33,28 @@ def test_home_response_matches_fixture(client, expected_home_response):
     response = client.get("/")
     assert response.status_code == 200
     
-    assert response.json() == expected_home_response
\ No newline at end of file
+    assert response.json() == expected_home_response
+
+
+# ------------------------------------------------------------------------------
+# Sector Endpoints
+# ------------------------------------------------------------------------------
+def test_sector_company_assessments():
+    """Test that the sector endpoint returns the record count and a sample of 5."""
+    response = client.get("/v1/sectors/company-assessments")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_records"] > 0
+    assert len(data["sample_data"]) == 5
+
+
+def test_startup_survives_unreadable_sector_file(monkeypatch):
+    """Test that a sector CSV that fails to parse does not stop the app from starting."""
+    import main
+
+    def broken_load():
+        raise ValueError("CSV parse error")
+
+    monkeypatch.setattr(main, "load_sector_file", broken_load)
+    with TestClient(main.create_app()) as startup_client:
+        assert startup_client.get("/").status_code == 200
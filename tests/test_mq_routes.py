@@ -79,6 +79,16 @@ def test_get_mq_by_methodology_success():
 # ------------------------------------------------------------------------------
 # Sector Trends Tests
 # ------------------------------------------------------------------------------
+def test_get_mq_by_methodology_filtered_by_mq_levels():
+    """Test that the mq_levels query parameter narrows the methodology results."""
+    response = client.get("/v1/mq/methodology/1?mq_levels=3")
+    assert response.status_code == 200
+    filtered_total = response.json()["total_records"]
+
+    unfiltered_total = client.get("/v1/mq/methodology/1").json()["total_records"]
+    assert 0 < filtered_total < unfiltered_total
+
+
 def test_get_mq_trends_sector_not_found():
     """Test that an invalid sector id returns a 404 error."""
     response = client.get(
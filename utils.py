@@ -4,17 +4,28 @@ Utility functions for data loading and normalization.
 This module provides helper functions used across the TPI API project, including:
 - Selecting the latest available data directory and CSV files based on naming conventions
 - Extracting embedded dates from filenames and folder names
-- Normalizing company names into consistent, URL-safe identifiers
+- Normalizing company names into consistent, URL-safe identifiers, one at a
+  time or a whole column at once
 """
 
 # -------------------------------------------------------------------------
 # Imports
 # -------------------------------------------------------------------------
 import re
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
 from typing import List
 
+import pandas as pd
+
+
+# -------------------------------------------------------------------------
+# Compiled Patterns
+# -------------------------------------------------------------------------
+# MMDDYYYY date embedded at the end of a CSV file name, e.g. "..._08032025.csv"
+FILE_DATE_PATTERN = re.compile(r"_(\d{8})\.csv$")
+
 
 # -------------------------------------------------------------------------
 # Utility Functions for Data Loading, File Selection, and Normalization
@@ -95,10 +106,8 @@ def get_latest_assessment_file(pattern: str, data_dir: Path) -> Path:
     if not files:
         raise FileNotFoundError("No company assessments files found.")
 
-    date_pattern = re.compile(r"_(\d{8})\.csv$")
-
     def extract_date(file_path: Path):
-        match = date_pattern.search(file_path.name)
+        match = FILE_DATE_PATTERN.search(file_path.name)
         if match:
             date_str = match.group(1)
             try:
@@ -142,9 +151,11 @@ def get_latest_cp_file(pattern: str, data_dir: Path) -> List[Path]:
     return files
 
 
+@lru_cache(maxsize=65536)
 def normalize_company_id(company_name: str) -> str:
     """
     Normalizes a company name into a lowercase, underscore-separated identifier.
+    Results are memoized, as the same names are normalized on every request.
 
     Steps:
         1. Strip leading/trailing whitespace
@@ -158,3 +169,19 @@ def normalize_company_id(company_name: str) -> str:
         str: Normalized company identifier.
     """
     return company_name.strip().replace(" ", "_").lower()
+
+
+def normalize_company_ids(company_names: pd.Series) -> pd.Series:
+    """
+    Vectorized version of normalize_company_id for a whole column of names.
+
+    Applies the same steps with pandas string methods, so loading a dataset
+    does not call normalize_company_id once per row. Missing names stay missing.
+
+    Parameters:
+        company_names (pd.Series): Raw company names.
+
+    Returns:
+        pd.Series: Normalized company identifiers, aligned with the input.
+    """
+    return company_names.str.strip().str.replace(" ", "_", regex=False).str.lower()